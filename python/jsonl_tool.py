@@ -1,47 +1,48 @@
 #!/usr/bin/env python3
 
-import sys
 import json
 import re
 import textwrap
 from argparse import ArgumentParser
 from rapidfuzz import fuzz
 from rich.console import Console
-from rich.syntax import Syntax
 from rich.traceback import install
-from rich.panel import Panel
-from rich.text import Text
-from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter
-from prompt_toolkit.shortcuts import radiolist_dialog
-from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.application import Application
-from prompt_toolkit.layout.containers import HSplit, Window
-from prompt_toolkit.layout.controls import FormattedTextControl
-from prompt_toolkit.layout import Layout
-from prompt_toolkit.formatted_text import HTML
+
+try:
+    import orjson
+except ImportError:  # optional speedup: pip install 'riff-interactive[fast]'
+    orjson = None
 
 install()
 console = Console()
 
+# Bare JSON brackets that carry no content when building snippets
+STRUCTURAL_LINES = frozenset(('{', '}', '[', ']'))
+
+# **highlighted** spans in snippets, and the placeholders wrap_text swaps them for
+HIGHLIGHT_RE = re.compile(r'\*\*.*?\*\*')
+PLACEHOLDER_RE = re.compile(r'__HIGHLIGHT_\d+__')
+
+# orjson turns integers outside the 64-bit range (below -2**63 or from 2**64 up)
+# into floats; any digit run this long might be one, so those lines are parsed
+# with json to keep the exact value. Checked against orjson 3.9.0 and 3.13.0.
+LONG_DIGITS_RE = re.compile(r'\d{19,}')
+
 def find_match_snippet(text, query, snippet_length=200):
     """Find meaningful content around the search term, not just JSON structure."""
     query_lower = query.lower()
     text_lower = text.lower()
     
-    # Find all occurrences of the query and query words
+    # Find the first occurrence of the query and each query word; later
+    # occurrences never affect the snippet, so don't collect them
     search_terms = [query_lower] + query_lower.split()
     all_matches = []
-    
+
     for term in search_terms:
-        start = 0
-        while True:
-            pos = text_lower.find(term, start)
-            if pos == -1:
-                break
+        pos = text_lower.find(term)
+        if pos != -1:
             all_matches.append((pos, len(term), term))
-            start = pos + 1
-    
+
     if not all_matches:
         # Fallback to beginning
         return {
@@ -81,7 +82,7 @@ def find_match_snippet(text, query, snippet_length=200):
     # Try to include complete key-value pairs or meaningful JSON chunks
     for i in range(start_line, end_line):
         line = lines[i].strip()
-        if line and not line in ['{', '}', '[', ']']:  # Skip empty structural lines
+        if line and line not in STRUCTURAL_LINES:  # Skip empty structural lines
             context_lines.append(lines[i])
     
     # If we don't have enough meaningful content, expand the search
@@ -128,8 +129,23 @@ def find_match_snippet(text, query, snippet_length=200):
         'end': match_line_start + len('\n'.join(context_lines))
     }
 
+if orjson is not None:
+    def loads_record(data):
+        """Parse one JSONL record, using json for lines orjson would reject (NaN, BOM) or round."""
+        if LONG_DIGITS_RE.search(data):
+            return json.loads(data)
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+else:
+    loads_record = json.loads
+
 def fuzzy_search(filepath, query, threshold=70):
     matches = []
+    # Bind the scorer to a local; it runs once per record
+    partial_ratio = fuzz.partial_ratio
+    query_lower = query.lower()
     try:
         with open(filepath, 'r') as f:
             for idx, line in enumerate(f):
@@ -137,17 +153,19 @@ def fuzzy_search(filepath, query, threshold=70):
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line)
+                    obj = loads_record(line)
                     text = json.dumps(obj, ensure_ascii=False, indent=2)
-                    score = fuzz.partial_ratio(query.lower(), text.lower())
+                    # score_cutoff lets rapidfuzz bail out early on lines that
+                    # can't reach the threshold; those come back as 0
+                    score = partial_ratio(query_lower, text.lower(),
+                                          score_cutoff=threshold)
                     if score >= threshold:
                         snippet_info = find_match_snippet(text, query)
                         matches.append({
                             'line_number': idx + 1,
                             'object': obj,
                             'score': score,
-                            'snippet': snippet_info['snippet'],
-                            'full_text': text
+                            'snippet': snippet_info['snippet']
                         })
                 except json.JSONDecodeError:
                     continue
@@ -159,10 +177,30 @@ def fuzzy_search(filepath, query, threshold=70):
     return matches
 
 def pretty_print(obj):
+    from rich.syntax import Syntax
+    
     text = json.dumps(obj, indent=2, ensure_ascii=False)
     syntax = Syntax(text, "json", theme="monokai", line_numbers=False)
     console.print(syntax)
 
+def protect_highlights(line):
+    """Replace **highlighted** spans with placeholders, returning the line and the mapping."""
+    placeholder_map = {}
+    
+    def to_placeholder(m):
+        placeholder = f"__HIGHLIGHT_{len(placeholder_map)}__"
+        placeholder_map[placeholder] = m.group(0)
+        return placeholder
+    
+    return HIGHLIGHT_RE.sub(to_placeholder, line), placeholder_map
+
+def restore_highlights(text, placeholder_map):
+    """Put back the highlighted spans protect_highlights replaced."""
+    def restore(m):
+        return placeholder_map.get(m.group(0), m.group(0))
+    
+    return PLACEHOLDER_RE.sub(restore, text)
+
 def wrap_text(text, width):
     """Wrap text to specified width, preserving highlighted terms and spaces."""
     lines = text.split('\n')
@@ -172,36 +210,18 @@ def wrap_text(text, width):
         if len(line) <= width:
             wrapped_lines.append(line)
         else:
-            # Handle highlighting by temporarily replacing markers
-            placeholder_map = {}
-            temp_line = line
-            marker_count = 0
-            
-            # Replace **text** with temporary placeholders
-            while '**' in temp_line:
-                start = temp_line.find('**')
-                if start == -1:
-                    break
-                end = temp_line.find('**', start + 2)
-                if end == -1:
-                    break
-                
-                original_text = temp_line[start:end+2]
-                placeholder = f"__HIGHLIGHT_{marker_count}__"
-                placeholder_map[placeholder] = original_text
-                temp_line = temp_line[:start] + placeholder + temp_line[end+2:]
-                marker_count += 1
+            # Swap **highlighted** spans for placeholders so textwrap never
+            # splits a marker, then restore them on each wrapped line
+            temp_line, placeholder_map = protect_highlights(line)
             
-            # Use textwrap to wrap the line with placeholders
-            wrapped = textwrap.fill(temp_line, width=width, 
-                                  break_long_words=True, 
-                                  break_on_hyphens=False)
+            wrapped = textwrap.wrap(temp_line, width=width,
+                                    break_long_words=True,
+                                    break_on_hyphens=False) or ['']
             
-            # Restore the highlighting markers
-            for placeholder, original in placeholder_map.items():
-                wrapped = wrapped.replace(placeholder, original)
+            if placeholder_map:
+                wrapped = [restore_highlights(w, placeholder_map) for w in wrapped]
             
-            wrapped_lines.extend(wrapped.split('\n'))
+            wrapped_lines.extend(wrapped)
     
     return wrapped_lines
 
@@ -211,18 +231,49 @@ def show_snippet_browser(matches, query):
         console.print("[yellow]No matches found.[/yellow]")
         return
     
+    # prompt_toolkit is only needed once there is something to browse;
+    # importing it here keeps no-match runs and --help fast
+    from prompt_toolkit.application import Application
+    from prompt_toolkit.key_binding import KeyBindings
+    from prompt_toolkit.layout import Layout
+    from prompt_toolkit.layout.containers import Window
+    from prompt_toolkit.layout.controls import FormattedTextControl
+    
     current_index = 0
     snippet_scroll_offset = 0
     max_display_lines = 15
     max_line_length = 80
+    separator = '=' * max_line_length
+    # Held-down n/p/u/d keys invalidate faster than a redraw is worth;
+    # coalesce them into at most one render per interval (seconds)
+    redraw_interval = 0.05
+    wrapped_cache = {}
+    display_key = None
+    display_text = None
+    
+    def get_wrapped_lines(index):
+        """Wrap a match's snippet once and reuse it across redraws and scrolls."""
+        wrapped = wrapped_cache.get(index)
+        if wrapped is None:
+            wrapped = wrap_text(matches[index]['snippet'], max_line_length)
+            wrapped_cache[index] = wrapped
+        return wrapped
     
     def get_display_text():
+        """Return the browser text, rebuilding it only when the view has moved."""
+        nonlocal display_key, display_text
+        key = (current_index, snippet_scroll_offset)
+        if key != display_key:
+            display_key = key
+            display_text = build_display_text()
+        return display_text
+    
+    def build_display_text():
         match = matches[current_index]
         header = f"Match {current_index + 1}/{len(matches)} (Score: {match['score']}) - Line {match['line_number']}"
-        snippet = match['snippet']
         
         # First, wrap the raw snippet to our line length
-        wrapped_snippet_lines = wrap_text(snippet, max_line_length)
+        wrapped_snippet_lines = get_wrapped_lines(current_index)
         
         # Apply scrolling to the wrapped lines
         total_lines = len(wrapped_snippet_lines)
@@ -248,7 +299,7 @@ def show_snippet_browser(matches, query):
             controls += ", [u]p, [d]own"
         controls += ", [q]uit"
         
-        return f"{header}{scroll_info}\n{'='*max_line_length}\n{display_snippet}\n{'='*max_line_length}\n{controls}"
+        return f"{header}{scroll_info}\n{separator}\n{display_snippet}\n{separator}\n{controls}"
     
     bindings = KeyBindings()
     
@@ -277,8 +328,7 @@ def show_snippet_browser(matches, query):
     @bindings.add('d')
     def scroll_down(event):
         nonlocal snippet_scroll_offset
-        match = matches[current_index]
-        wrapped_lines = wrap_text(match['snippet'], max_line_length)
+        wrapped_lines = get_wrapped_lines(current_index)
         max_scroll = max(0, len(wrapped_lines) - max_display_lines)
         snippet_scroll_offset = min(max_scroll, snippet_scroll_offset + 3)
         event.app.invalidate()
@@ -301,7 +351,8 @@ def show_snippet_browser(matches, query):
     )
     
     layout = Layout(Window(content=text_control))
-    app = Application(layout=layout, key_bindings=bindings, full_screen=False)
+    app = Application(layout=layout, key_bindings=bindings, full_screen=False,
+                      min_redraw_interval=redraw_interval)
     
     while True:
         result = app.run()
@@ -311,7 +362,8 @@ def show_snippet_browser(matches, query):
             pretty_print(matches[current_index]['object'])
             console.print("\n[dim]Press Enter to continue browsing...[/dim]")
             input()
-            app = Application(layout=layout, key_bindings=bindings, full_screen=False)
+            app = Application(layout=layout, key_bindings=bindings, full_screen=False,
+                              min_redraw_interval=redraw_interval)
         else:
             break
 
@@ -9,6 +9,56 @@ import re
 import sys
 from typing import List, Dict, Any
 
+# Routing patterns, compiled once and checked in priority order by route_search_intent
+CONVERSATION_ROUTE_RE = re.compile(r'\b(conversation|chat|discuss|talk|dialogue)\b')
+PROJECT_ROUTE_RE = re.compile(r'\b(project|documentation|docs|implement|build)\b')
+TECHNICAL_ROUTE_RE = re.compile(r'\b(code|technical|implementation|api|config)\b')
+USER_ROUTE_RE = re.compile(r'\b(user|person|author|creator)\b')
+
+# Keyword extraction patterns used by extract_pattern_keywords
+QUOTED_PHRASE_RE = re.compile(r'"([^"]*)"')
+TECH_TERM_RE = re.compile(r'\b[a-z]+[A-Z][a-zA-Z]*\b|\b[a-z]+-[a-z-]+\b')
+ABBREVIATION_RE = re.compile(r'\b[A-Z]{2,}\b')
+
+# Technical domain patterns with comprehensive expansions
+DOMAIN_PATTERNS = {
+    'nabia': ['federation', 'memchain', 'orchestration', 'agent', 'coordination', 'protocol', 'cognitive', 'intelligence'],
+    'claude': ['assistant', 'conversation', 'chat', 'ai', 'llm', 'dialogue', 'anthropic', 'subagent'],
+    'linear': ['issue', 'project', 'task', 'ticket', 'workflow', 'development', 'tracking', 'milestone'],
+    'federation': ['agent', 'coordination', 'protocol', 'handoff', 'orchestration', 'distributed', 'network', 'mesh'],
+    'memory': ['storage', 'retrieval', 'context', 'persistent', 'ephemeral', 'knowledge', 'cache', 'state'],
+    'search': ['query', 'find', 'lookup', 'discover', 'filter', 'match', 'locate', 'identify'],
+    'integration': ['api', 'webhook', 'connection', 'sync', 'bridge', 'interface', 'mcp', 'proxy'],
+    'architecture': ['design', 'pattern', 'structure', 'framework', 'system', 'blueprint', 'topology'],
+    'git': ['commit', 'branch', 'merge', 'repository', 'version', 'control', 'diff', 'pull request'],
+    'riff': ['search', 'uuid', 'jsonl', 'conversation', 'logs', 'cli', 'tool', 'query'],
+    'agent': ['subagent', 'orchestrator', 'delegation', 'task', 'autonomous', 'cognitive', 'intelligent'],
+    'oauth': ['authentication', 'authorization', 'token', 'proxy', 'grok', 'notion', 'api']
+}
+
+# Action-based expansions
+ACTION_PATTERNS = {
+    'find': ['search', 'locate', 'discover', 'identify', 'retrieve', 'lookup'],
+    'search': ['find', 'query', 'scan', 'browse', 'explore', 'investigate'],
+    'discuss': ['talk', 'conversation', 'dialogue', 'chat', 'communication', 'exchange'],
+    'implement': ['build', 'create', 'develop', 'construct', 'design', 'code'],
+    'configure': ['setup', 'initialize', 'customize', 'adjust', 'modify', 'tune'],
+    'integrate': ['connect', 'link', 'bridge', 'sync', 'merge', 'combine'],
+    'debug': ['troubleshoot', 'diagnose', 'fix', 'resolve', 'investigate', 'analyze']
+}
+
+# Semantic relationship mappings
+SEMANTIC_MAPS = {
+    'agent': ['bot', 'assistant', 'worker', 'service', 'process'],
+    'system': ['platform', 'framework', 'infrastructure', 'architecture'],
+    'data': ['information', 'content', 'payload', 'dataset', 'record'],
+    'process': ['workflow', 'pipeline', 'procedure', 'operation', 'task'],
+    'network': ['connection', 'link', 'channel', 'communication', 'protocol'],
+    'interface': ['api', 'endpoint', 'contract', 'specification', 'definition'],
+    'state': ['status', 'condition', 'mode', 'phase', 'situation'],
+    'event': ['message', 'signal', 'notification', 'trigger', 'callback']
+}
+
 def enhance_search_intent(original_intent: str, depth: int = 3) -> List[str]:
     """
     Enhance search keywords using pattern matching and domain knowledge
@@ -43,36 +93,20 @@ def extract_pattern_keywords(intent: str) -> List[str]:
     intent_lower = intent.lower()
     keywords = []
     
-    # Technical domain patterns with comprehensive expansions
-    domain_patterns = {
-        'nabia': ['federation', 'memchain', 'orchestration', 'agent', 'coordination', 'protocol', 'cognitive', 'intelligence'],
-        'claude': ['assistant', 'conversation', 'chat', 'ai', 'llm', 'dialogue', 'anthropic', 'subagent'],
-        'linear': ['issue', 'project', 'task', 'ticket', 'workflow', 'development', 'tracking', 'milestone'],
-        'federation': ['agent', 'coordination', 'protocol', 'handoff', 'orchestration', 'distributed', 'network', 'mesh'],
-        'memory': ['storage', 'retrieval', 'context', 'persistent', 'ephemeral', 'knowledge', 'cache', 'state'],
-        'search': ['query', 'find', 'lookup', 'discover', 'filter', 'match', 'locate', 'identify'],
-        'integration': ['api', 'webhook', 'connection', 'sync', 'bridge', 'interface', 'mcp', 'proxy'],
-        'architecture': ['design', 'pattern', 'structure', 'framework', 'system', 'blueprint', 'topology'],
-        'git': ['commit', 'branch', 'merge', 'repository', 'version', 'control', 'diff', 'pull request'],
-        'riff': ['search', 'uuid', 'jsonl', 'conversation', 'logs', 'cli', 'tool', 'query'],
-        'agent': ['subagent', 'orchestrator', 'delegation', 'task', 'autonomous', 'cognitive', 'intelligent'],
-        'oauth': ['authentication', 'authorization', 'token', 'proxy', 'grok', 'notion', 'api']
-    }
-    
-    for term, expansions in domain_patterns.items():
+    for term, expansions in DOMAIN_PATTERNS.items():
         if term in intent_lower:
             keywords.extend(expansions)
     
     # Extract quoted phrases
-    quoted_phrases = re.findall(r'"([^"]*)"', intent)
+    quoted_phrases = QUOTED_PHRASE_RE.findall(intent)
     keywords.extend(quoted_phrases)
     
     # Extract camelCase and kebab-case terms
-    tech_terms = re.findall(r'\b[a-z]+[A-Z][a-zA-Z]*\b|\b[a-z]+-[a-z-]+\b', intent)
+    tech_terms = TECH_TERM_RE.findall(intent)
     keywords.extend(tech_terms)
     
     # Extract technical abbreviations
-    abbreviations = re.findall(r'\b[A-Z]{2,}\b', intent)
+    abbreviations = ABBREVIATION_RE.findall(intent)
     keywords.extend(abbreviations)
     
     return keywords
@@ -82,18 +116,7 @@ def generate_domain_keywords(intent: str, depth: int) -> List[str]:
     intent_lower = intent.lower()
     keywords = []
     
-    # Action-based expansions
-    action_patterns = {
-        'find': ['search', 'locate', 'discover', 'identify', 'retrieve', 'lookup'],
-        'search': ['find', 'query', 'scan', 'browse', 'explore', 'investigate'],
-        'discuss': ['talk', 'conversation', 'dialogue', 'chat', 'communication', 'exchange'],
-        'implement': ['build', 'create', 'develop', 'construct', 'design', 'code'],
-        'configure': ['setup', 'initialize', 'customize', 'adjust', 'modify', 'tune'],
-        'integrate': ['connect', 'link', 'bridge', 'sync', 'merge', 'combine'],
-        'debug': ['troubleshoot', 'diagnose', 'fix', 'resolve', 'investigate', 'analyze']
-    }
-    
-    for action, synonyms in action_patterns.items():
+    for action, synonyms in ACTION_PATTERNS.items():
         if action in intent_lower:
             keywords.extend(synonyms[:depth])  # Limit by depth
     
@@ -117,19 +140,7 @@ def generate_semantic_variations(intent: str) -> List[str]:
     intent_lower = intent.lower()
     keywords = []
     
-    # Semantic relationship mappings
-    semantic_maps = {
-        'agent': ['bot', 'assistant', 'worker', 'service', 'process'],
-        'system': ['platform', 'framework', 'infrastructure', 'architecture'],
-        'data': ['information', 'content', 'payload', 'dataset', 'record'],
-        'process': ['workflow', 'pipeline', 'procedure', 'operation', 'task'],
-        'network': ['connection', 'link', 'channel', 'communication', 'protocol'],
-        'interface': ['api', 'endpoint', 'contract', 'specification', 'definition'],
-        'state': ['status', 'condition', 'mode', 'phase', 'situation'],
-        'event': ['message', 'signal', 'notification', 'trigger', 'callback']
-    }
-    
-    for base_term, variations in semantic_maps.items():
+    for base_term, variations in SEMANTIC_MAPS.items():
         if base_term in intent_lower:
             keywords.extend(variations)
     
@@ -152,7 +163,7 @@ def route_search_intent(intent: str) -> Dict[str, Any]:
     intent_lower = intent.lower()
     
     # Conversation search patterns
-    if re.search(r'\b(conversation|chat|discuss|talk|dialogue)\b', intent_lower):
+    if CONVERSATION_ROUTE_RE.search(intent_lower):
         return {
             "strategy": "conversation_focused",
             "primary_source": "conversations",
@@ -162,7 +173,7 @@ def route_search_intent(intent: str) -> Dict[str, Any]:
         }
     
     # Project/documentation search patterns  
-    if re.search(r'\b(project|documentation|docs|implement|build)\b', intent_lower):
+    if PROJECT_ROUTE_RE.search(intent_lower):
         return {
             "strategy": "project_focused", 
             "primary_source": "projects",
@@ -172,7 +183,7 @@ def route_search_intent(intent: str) -> Dict[str, Any]:
         }
     
     # Technical/code search patterns
-    if re.search(r'\b(code|technical|implementation|api|config)\b', intent_lower):
+    if TECHNICAL_ROUTE_RE.search(intent_lower):
         return {
             "strategy": "technical_focused",
             "primary_source": "both",
@@ -181,7 +192,7 @@ def route_search_intent(intent: str) -> Dict[str, Any]:
         }
     
     # User/identity search patterns
-    if re.search(r'\b(user|person|author|creator)\b', intent_lower):
+    if USER_ROUTE_RE.search(intent_lower):
         return {
             "strategy": "user_focused",
             "primary_source": "users",